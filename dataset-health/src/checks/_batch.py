@@ -0,0 +1,199 @@
+"""Batched NumPy fast path for the built-in numeric checks.
+
+For large registries the per-dataset threshold ladders in the
+completeness, volume, and freshness checks are interpreter-bound.
+``batch_numeric`` extracts the numeric fields once, computes ratios and
+ages with vector operations, and returns per-dataset results that are
+identical to the scalar check functions. Datasets with missing or
+invalid fields are skipped so the scalar path can report them.
+
+NumPy is optional; without it ``batch_numeric`` returns an empty mapping
+and evaluation falls back to the scalar checks.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+from registry import CheckRegistry, CheckResult, Dataset, Status
+from checks import _kernels
+from checks.completeness import check_completeness
+from checks.freshness import check_freshness
+from checks.volume import check_volume, _format_bytes
+
+
+_STATUS_BY_CODE = (Status.GREEN, Status.YELLOW, Status.RED)
+
+_COMPLETENESS_MESSAGES = (
+    "Record count meets expected minimum.",
+    "Record count slightly below expected minimum.",
+    "Record count significantly below expected minimum.",
+)
+
+_VOLUME_MESSAGES = (
+    "Volume meets expected minimum.",
+    "Volume slightly below expected minimum.",
+    "Volume significantly below expected minimum.",
+)
+
+
+def _completeness_result(value: float, minimum: float, ratio: float, code: int) -> CheckResult:
+    return CheckResult(
+        name="completeness",
+        status=_STATUS_BY_CODE[code],
+        message=_COMPLETENESS_MESSAGES[code],
+        details={
+            "record_count": value,
+            "expected_min_records": minimum,
+            "ratio": round(ratio, 3),
+        },
+    )
+
+
+def _volume_result(value: float, minimum: float, ratio: float, code: int) -> CheckResult:
+    return CheckResult(
+        name="volume",
+        status=_STATUS_BY_CODE[code],
+        message=_VOLUME_MESSAGES[code],
+        details={
+            "bytes": value,
+            "expected_min_bytes": minimum,
+            "ratio": round(ratio, 3),
+            "bytes_human": _format_bytes(value),
+            "expected_min_human": _format_bytes(minimum),
+        },
+    )
+
+
+def _batch_ratio(
+    datasets: List[Dataset],
+    out: Dict[int, Dict[str, CheckResult]],
+    name: str,
+    value_key: str,
+    min_key: str,
+    build_result: Callable[[float, float, float, int], CheckResult],
+) -> None:
+    indices: List[int] = []
+    values: List[float] = []
+    minimums: List[float] = []
+    for index, dataset in enumerate(datasets):
+        raw_value = dataset.get(value_key)
+        raw_min = dataset.get(min_key)
+        if raw_value is None or raw_min is None:
+            continue
+        try:
+            value = float(raw_value)
+            minimum = float(raw_min)
+        except (TypeError, ValueError):
+            continue
+        if minimum <= 0:
+            continue
+        indices.append(index)
+        values.append(value)
+        minimums.append(minimum)
+
+    if not indices:
+        return
+
+    value_arr = np.asarray(values, dtype=np.float64)
+    min_arr = np.asarray(minimums, dtype=np.float64)
+    ratio_arr = value_arr / min_arr
+    codes = _kernels.classify_ratio(value_arr, min_arr)
+    for position, index in enumerate(indices):
+        result = build_result(
+            float(value_arr[position]),
+            float(min_arr[position]),
+            float(ratio_arr[position]),
+            int(codes[position]),
+        )
+        out.setdefault(index, {})[name] = result
+
+
+def _batch_freshness(
+    datasets: List[Dataset],
+    now: datetime,
+    out: Dict[int, Dict[str, CheckResult]],
+) -> None:
+    indices: List[int] = []
+    timestamps: List[float] = []
+    slas: List[float] = []
+    parsed: List[datetime] = []
+    for index, dataset in enumerate(datasets):
+        last_updated = dataset.get_datetime("last_updated")
+        raw_sla = dataset.get("freshness_hours")
+        if last_updated is None or raw_sla is None:
+            continue
+        try:
+            sla_hours = float(raw_sla)
+        except (TypeError, ValueError):
+            continue
+        indices.append(index)
+        timestamps.append(last_updated.timestamp())
+        slas.append(sla_hours)
+        parsed.append(last_updated)
+
+    if not indices:
+        return
+
+    age_arr = (now.timestamp() - np.asarray(timestamps, dtype=np.float64)) / 3600.0
+    sla_arr = np.asarray(slas, dtype=np.float64)
+    codes = _kernels.classify_age(age_arr, sla_arr)
+    for position, index in enumerate(indices):
+        age_hours = float(age_arr[position])
+        sla_hours = float(sla_arr[position])
+        result = CheckResult(
+            name="freshness",
+            status=_STATUS_BY_CODE[int(codes[position])],
+            message=f"Age {age_hours:.1f}h (SLA {sla_hours:.1f}h).",
+            details={
+                "last_updated": parsed[position].isoformat(),
+                "age_hours": round(age_hours, 2),
+                "sla_hours": sla_hours,
+            },
+        )
+        out.setdefault(index, {})["freshness"] = result
+
+
+def batch_numeric(
+    datasets: List[Dataset],
+    registry: CheckRegistry,
+    now: datetime,
+) -> Dict[int, Dict[str, CheckResult]]:
+    """Precompute results for the built-in numeric checks.
+
+    Returns a mapping of dataset index to per-check results. Only checks
+    registered with their built-in runner are batched, so customized
+    registries keep their own behavior.
+    """
+    results: Dict[int, Dict[str, CheckResult]] = {}
+    if np is None:
+        return results
+
+    runners = {spec.name: spec.runner for spec in registry.list()}
+    if runners.get("completeness") is check_completeness:
+        _batch_ratio(
+            datasets,
+            results,
+            name="completeness",
+            value_key="record_count",
+            min_key="expected_min_records",
+            build_result=_completeness_result,
+        )
+    if runners.get("volume") is check_volume:
+        _batch_ratio(
+            datasets,
+            results,
+            name="volume",
+            value_key="bytes",
+            min_key="expected_min_bytes",
+            build_result=_volume_result,
+        )
+    if runners.get("freshness") is check_freshness:
+        _batch_freshness(datasets, now, results)
+    return results
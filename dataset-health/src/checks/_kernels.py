@@ -0,0 +1,67 @@
+"""Optional Numba-compiled kernels for the batched numeric checks.
+
+The threshold ladders in the batched evaluator reduce to tiny numeric
+loops that Numba compiles to native code. When Numba is not installed
+the same classifications are computed with NumPy vector operations, so
+callers never need to branch on availability.
+
+Status codes follow the severity order used across the package:
+0 = GREEN, 1 = YELLOW, 2 = RED.
+"""
+
+from __future__ import annotations
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - optional dependency
+    njit = None
+
+HAS_NUMBA = njit is not None
+
+
+if HAS_NUMBA:  # pragma: no cover - depends on optional dependency
+
+    @njit(cache=True)
+    def classify_ratio(values, minimums):
+        codes = np.empty(values.shape[0], dtype=np.int8)
+        for index in range(values.shape[0]):
+            if values[index] >= minimums[index]:
+                codes[index] = 0
+            elif values[index] / minimums[index] >= 0.9:
+                codes[index] = 1
+            else:
+                codes[index] = 2
+        return codes
+
+    @njit(cache=True)
+    def classify_age(ages, slas):
+        codes = np.empty(ages.shape[0], dtype=np.int8)
+        for index in range(ages.shape[0]):
+            if ages[index] <= slas[index]:
+                codes[index] = 0
+            elif ages[index] <= slas[index] * 1.5:
+                codes[index] = 1
+            else:
+                codes[index] = 2
+        return codes
+
+    # Warm-up calls pay the JIT cold start once at import time.
+    classify_ratio(np.ones(1, dtype=np.float64), np.ones(1, dtype=np.float64))
+    classify_age(np.zeros(1, dtype=np.float64), np.ones(1, dtype=np.float64))
+
+elif np is not None:
+
+    def classify_ratio(values, minimums):
+        return np.where(
+            values >= minimums, 0, np.where(values / minimums >= 0.9, 1, 2)
+        ).astype(np.int8)
+
+    def classify_age(ages, slas):
+        return np.where(
+            ages <= slas, 0, np.where(ages <= slas * 1.5, 1, 2)
+        ).astype(np.int8)
@@ -1,13 +1,17 @@
 from datetime import datetime, timezone
 from typing import Any
 
-from registry import CheckResult, Status, register_check, parse_datetime
+from registry import CheckResult, Status, register_check
+
+
+_INV_3600 = 1.0 / 3600.0
 
 
 @register_check(name="freshness", description="Data is updated within freshness SLA.")
 def check_freshness(dataset: Any, now: datetime) -> CheckResult:
-    now = now or datetime.now(timezone.utc)
-    last_updated = parse_datetime(dataset.get("last_updated"))
+    if now is None:
+        now = datetime.now(timezone.utc)
+    last_updated = dataset.get_datetime("last_updated")
     freshness_hours = dataset.get("freshness_hours")
 
     if last_updated is None or freshness_hours is None:
@@ -28,7 +32,7 @@ def check_freshness(dataset: Any, now: datetime) -> CheckResult:
             details={"freshness_hours": freshness_hours},
         )
 
-    age_hours = (now - last_updated).total_seconds() / 3600
+    age_hours = (now - last_updated).total_seconds() * _INV_3600
     if age_hours <= sla_hours:
         status = Status.GREEN
     elif age_hours <= sla_hours * 1.5:
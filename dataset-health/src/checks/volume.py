@@ -3,17 +3,16 @@ from typing import Any
 from registry import CheckResult, Status, register_check
 
 
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_FACTORS = (1, 1024, 1024 ** 2, 1024 ** 3, 1024 ** 4)
+
+
 def _format_bytes(value: float) -> str:
-    thresholds = [
-        (1024 ** 4, "TB"),
-        (1024 ** 3, "GB"),
-        (1024 ** 2, "MB"),
-        (1024, "KB"),
-    ]
-    for factor, unit in thresholds:
-        if value >= factor:
-            return f"{value / factor:.2f} {unit}"
-    return f"{value:.0f} B"
+    # Unit index from the bit length: each 10 bits is one 1024x step.
+    index = min(4, (int(value).bit_length() - 1) // 10) if value >= 1 else 0
+    if index == 0:
+        return f"{value:.0f} B"
+    return f"{value / _FACTORS[index]:.2f} {_UNITS[index]}"
 
 
 @register_check(name="volume", description="Dataset volume meets expected minimum.")
@@ -5,16 +5,7 @@ import json
 from pathlib import Path
 import sys
 
-from explain import render_html
 from health import evaluate_all
-from output import (
-    emit_cloudwatch_metrics,
-    overall_status,
-    parse_cloudwatch_dimensions,
-    render_jsonl,
-    render_prometheus,
-    render_summary_json,
-)
 from registry import (
     CHECK_REGISTRY,
     DatasetRegistry,
@@ -52,6 +43,11 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Print JSON report to stdout.",
     )
+    parser.add_argument(
+        "--compact",
+        action="store_true",
+        help="Emit compact JSON (no indentation or key sorting) for --output and --stdout.",
+    )
     parser.add_argument(
         "--fail-on",
         choices=["none", "yellow", "red"],
@@ -73,6 +69,12 @@ def build_parser() -> argparse.ArgumentParser:
         default="",
         help="Comma-separated CloudWatch dimensions (key=value,key2=value2).",
     )
+    parser.add_argument(
+        "--cloudwatch-batch-size",
+        type=int,
+        default=20,
+        help="Metrics per PutMetricData call (max 20, the API ceiling).",
+    )
     parser.add_argument(
         "--cloudwatch-no-datasets",
         action="store_true",
@@ -83,9 +85,61 @@ def build_parser() -> argparse.ArgumentParser:
         default=None,
         help="Override current time (ISO 8601) for deterministic runs.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of parallel workers for dataset evaluation (default: automatic).",
+    )
     return parser
 
 
+# Reusable encoders: pretty for human-facing report files, compact for
+# machine-facing output where indentation and key sorting are wasted work.
+_PRETTY_ENCODER = json.JSONEncoder(indent=2, ensure_ascii=True, sort_keys=True)
+_COMPACT_ENCODER = json.JSONEncoder(separators=(",", ":"), ensure_ascii=True)
+
+
+def _dump_json(payload: object, fp, compact: bool = False) -> None:
+    encoder = _COMPACT_ENCODER if compact else _PRETTY_ENCODER
+    for chunk in encoder.iterencode(payload):
+        fp.write(chunk)
+
+
+def _write_json(payload: object, path: Path, compact: bool = False) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w") as fp:
+        _dump_json(payload, fp, compact=compact)
+
+
+def _stream_report_json(report, fp) -> None:
+    """Write the full report as compact JSON one dataset at a time.
+
+    Keeps memory O(1) in the number of datasets: no report-wide dict tree
+    or serialized string is ever materialized.
+    """
+    encode = _COMPACT_ENCODER.encode
+    fp.write('{"generated_at":')
+    fp.write(encode(report.generated_at.isoformat()))
+    fp.write(',"summary":')
+    fp.write(encode(report.summary()))
+    fp.write(',"datasets":[')
+    first = True
+    for payload in report.iter_datasets_as_dict():
+        if not first:
+            fp.write(",")
+        first = False
+        fp.write(encode(payload))
+    fp.write("]}")
+
+
+def _write_report(report, fp, compact: bool = False) -> None:
+    if compact:
+        _stream_report_json(report, fp)
+    else:
+        _dump_json(report.to_dict(), fp)
+
+
 def main() -> int:
     args = build_parser().parse_args()
     dataset_path = Path(args.datasets)
@@ -100,27 +154,55 @@ def main() -> int:
             print(f"Plugin warning: {error}", file=sys.stderr)
 
     now = parse_datetime(args.now) if args.now else None
-    report = evaluate_all(registry.list(), CHECK_REGISTRY, now=now)
-    report_payload = report.to_dict()
+    report = evaluate_all(registry.list(), CHECK_REGISTRY, now=now, max_workers=args.workers)
+
+    # Output backends are imported lazily so each invocation only pays for
+    # the formats it actually emits (CloudWatch in particular pulls boto3).
+    from output import overall_status
+
     overall = overall_status(report)
 
     if args.output:
         if args.output == "report-json":
-            output_text = json.dumps(
-                report_payload, indent=2, ensure_ascii=True, sort_keys=True
-            )
+            if args.stdout or not args.out:
+                _write_report(report, sys.stdout, compact=args.compact)
+                sys.stdout.write("\n")
+            else:
+                out_path = Path(args.out)
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                with out_path.open("w") as fp:
+                    _write_report(report, fp, compact=args.compact)
+            output_text = None
         elif args.output == "summary-json":
-            output_text = json.dumps(
-                render_summary_json(report),
-                indent=2,
-                ensure_ascii=True,
-                sort_keys=True,
-            )
+            from output import render_summary_json
+
+            payload = render_summary_json(report)
+            if args.stdout or not args.out:
+                _dump_json(payload, sys.stdout, compact=args.compact)
+                sys.stdout.write("\n")
+            else:
+                _write_json(payload, Path(args.out), compact=args.compact)
+            output_text = None
         elif args.output == "jsonl":
-            output_text = render_jsonl(report)
+            if args.stdout or not args.out:
+                from output import render_jsonl
+
+                output_text = render_jsonl(report)
+            else:
+                from output import write_jsonl
+
+                out_path = Path(args.out)
+                out_path.parent.mkdir(parents=True, exist_ok=True)
+                with out_path.open("w") as fp:
+                    write_jsonl(report, fp)
+                output_text = None
         elif args.output == "prometheus":
+            from output import render_prometheus
+
             output_text = render_prometheus(report)
         elif args.output == "cloudwatch":
+            from output import emit_cloudwatch_metrics, parse_cloudwatch_dimensions
+
             try:
                 dimensions = parse_cloudwatch_dimensions(args.cloudwatch_dimensions)
                 emit_cloudwatch_metrics(
@@ -129,6 +211,8 @@ def main() -> int:
                     base_dimensions=dimensions,
                     region=args.cloudwatch_region,
                     include_datasets=not args.cloudwatch_no_datasets,
+                    batch_size=args.cloudwatch_batch_size,
+                    overall=overall,
                 )
             except Exception as exc:
                 print(f"CloudWatch output failed: {exc}", file=sys.stderr)
@@ -146,23 +230,25 @@ def main() -> int:
                 out_path.write_text(output_text)
     else:
         if args.stdout:
-            print(json.dumps(report_payload, indent=2, ensure_ascii=True, sort_keys=True))
+            _write_report(report, sys.stdout, compact=args.compact)
+            sys.stdout.write("\n")
 
         if not args.no_json:
             json_path = Path(args.out_json)
             json_path.parent.mkdir(parents=True, exist_ok=True)
-            json_path.write_text(
-                json.dumps(report_payload, indent=2, ensure_ascii=True, sort_keys=True)
-            )
+            with json_path.open("w") as fp:
+                _write_report(report, fp)
 
         if not args.no_html:
+            from explain import render_html
+
             html_path = Path(args.out_html)
             html_path.parent.mkdir(parents=True, exist_ok=True)
             html_path.write_text(render_html(report))
 
-    if args.fail_on == "red" and overall == Status.RED:
+    if args.fail_on == "red" and overall is Status.RED:
         return 2
-    if args.fail_on == "yellow" and overall in (Status.YELLOW, Status.RED):
+    if args.fail_on == "yellow" and overall is not Status.GREEN:
         return 2
     return 0
 
@@ -5,6 +5,29 @@ import json
 from typing import Any, Dict, Iterable, List
 
 from health import HealthReport
+from registry import Status
+
+
+_STATUS_CLASS = {status.value: status.value.lower() for status in Status}
+
+# Details dicts are built in a fixed key order by the checks, so compact
+# single-line encoding stays deterministic without sort_keys.
+_DETAILS_ENCODER = json.JSONEncoder(separators=(",", ": "), ensure_ascii=True)
+
+_escape_cache: Dict[str, str] = {}
+
+
+def _escape_cached(value: str) -> str:
+    """Escape with memoization for low-cardinality values.
+
+    Check names, status strings, and owners repeat across every dataset
+    in a report; cache their escaped forms instead of re-escaping.
+    """
+    escaped = _escape_cache.get(value)
+    if escaped is None:
+        escaped = escape(value)
+        _escape_cache[value] = escaped
+    return escaped
 
 
 def _format_value(value: Any) -> str:
@@ -16,165 +39,212 @@ def _format_value(value: Any) -> str:
 
 
 def _status_class(status: str) -> str:
-    return status.lower()
+    return _STATUS_CLASS[status]
+
+
+_HTML_STYLE = """\
+  <style>
+    :root {
+      --green: #1f7a1f;
+      --yellow: #b36b00;
+      --red: #b00020;
+      --bg: #f6f7fb;
+      --card: #ffffff;
+      --text: #1b1f24;
+      --muted: #5d6771;
+    }
+    * { box-sizing: border-box; }
+    body {
+      margin: 0;
+      font-family: Arial, sans-serif;
+      color: var(--text);
+      background: var(--bg);
+    }
+    .container {
+      max-width: 1100px;
+      margin: 0 auto;
+      padding: 32px 24px 60px;
+    }
+    header {
+      display: flex;
+      align-items: baseline;
+      justify-content: space-between;
+      flex-wrap: wrap;
+      gap: 12px;
+    }
+    h1 { margin: 0; font-size: 28px; }
+    .muted { color: var(--muted); font-size: 14px; }
+    .summary {
+      display: grid;
+      grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
+      gap: 16px;
+      margin: 24px 0;
+    }
+    .card {
+      background: var(--card);
+      padding: 16px;
+      border-radius: 10px;
+      box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);
+    }
+    .card h2 { margin: 0 0 6px; font-size: 18px; }
+    .status-pill {
+      display: inline-flex;
+      align-items: center;
+      gap: 6px;
+      font-weight: 600;
+      padding: 4px 10px;
+      border-radius: 999px;
+      font-size: 12px;
+      letter-spacing: 0.04em;
+    }
+    .status-pill.green { background: rgba(31, 122, 31, 0.12); color: var(--green); }
+    .status-pill.yellow { background: rgba(179, 107, 0, 0.12); color: var(--yellow); }
+    .status-pill.red { background: rgba(176, 0, 32, 0.12); color: var(--red); }
+    .dataset {
+      background: var(--card);
+      border-radius: 12px;
+      padding: 20px;
+      margin-bottom: 20px;
+      border-left: 6px solid transparent;
+    }
+    .dataset.green { border-left-color: var(--green); }
+    .dataset.yellow { border-left-color: var(--yellow); }
+    .dataset.red { border-left-color: var(--red); }
+    .dataset-header {
+      display: flex;
+      align-items: center;
+      justify-content: space-between;
+      gap: 12px;
+      flex-wrap: wrap;
+    }
+    .dataset-header h2 { margin: 0; font-size: 20px; }
+    .meta-grid {
+      display: grid;
+      grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));
+      gap: 10px 20px;
+      margin: 14px 0 18px;
+      font-size: 14px;
+    }
+    .meta-grid div span { color: var(--muted); }
+    table { width: 100%; border-collapse: collapse; }
+    th, td { text-align: left; padding: 10px 8px; font-size: 14px; }
+    th { border-bottom: 1px solid #e0e4ea; color: var(--muted); }
+    tr + tr td { border-top: 1px solid #f0f2f5; }
+    details { margin-top: 6px; }
+    pre {
+      background: #f4f5f8;
+      padding: 10px;
+      border-radius: 8px;
+      overflow-x: auto;
+      white-space: pre-wrap;
+      font-size: 12px;
+    }
+  </style>
+"""
+
+_HTML_HEAD_TEMPLATE = (
+    "<!doctype html>\n"
+    '<html lang="en">\n'
+    "<head>\n"
+    '  <meta charset="utf-8" />\n'
+    "  <title>{title}</title>\n"
+)
+
+_HTML_BODY_OPEN_TEMPLATE = (
+    "</head>\n"
+    "<body>\n"
+    '  <div class="container">\n'
+    "    <header>\n"
+    "      <h1>{title}</h1>\n"
+    '      <div class="muted">Generated at {generated_at}</div>\n'
+    "    </header>\n"
+    '    <section class="summary">\n'
+    '      <div class="card"><h2>Total</h2><div>{total}</div></div>\n'
+    '      <div class="card"><h2>Green</h2><div>{green}</div></div>\n'
+    '      <div class="card"><h2>Yellow</h2><div>{yellow}</div></div>\n'
+    '      <div class="card"><h2>Red</h2><div>{red}</div></div>\n'
+    "    </section>\n"
+)
+
+_DATASET_OPEN_TEMPLATE = (
+    '    <section class="dataset {cls}">\n'
+    '      <div class="dataset-header">\n'
+    "        <h2>{name}</h2>\n"
+    '        <span class="status-pill {cls}">{status}</span>\n'
+    "      </div>\n"
+    '      <div class="meta-grid">\n'
+    "        <div><span>Description:</span> {description}</div>\n"
+    "        <div><span>Location:</span> {location}</div>\n"
+    "        <div><span>Owner:</span> {owner}</div>\n"
+    "        <div><span>Source:</span> {source}</div>\n"
+    "        <div><span>Last Updated:</span> {last_updated}</div>\n"
+    "      </div>\n"
+    "      <table>\n"
+    "        <thead>\n"
+    "          <tr>\n"
+    "            <th>Check</th>\n"
+    "            <th>Status</th>\n"
+    "            <th>Message</th>\n"
+    "            <th>Details</th>\n"
+    "          </tr>\n"
+    "        </thead>\n"
+    "        <tbody>\n"
+)
+
+# %-formatting keeps the hot per-check row a single C-level substitution.
+_ROW_TEMPLATE = (
+    "          <tr>\n"
+    "            <td>%s</td>\n"
+    '            <td><span class="status-pill %s">%s</span></td>\n'
+    "            <td>%s</td>\n"
+    "            <td>%s</td>\n"
+    "          </tr>\n"
+)
+
+_DATASET_CLOSE = "        </tbody>\n      </table>\n    </section>\n"
+
+_HTML_EPILOGUE = "  </div>\n</body>\n</html>"
 
 
 def render_html(report: HealthReport, title: str = "Dataset Health") -> str:
     summary = report.summary()
+    title_escaped = escape(title)
 
-    lines: List[str] = [
-        "<!doctype html>",
-        "<html lang=\"en\">",
-        "<head>",
-        "  <meta charset=\"utf-8\" />",
-        f"  <title>{escape(title)}</title>",
-        "  <style>",
-        "    :root {",
-        "      --green: #1f7a1f;",
-        "      --yellow: #b36b00;",
-        "      --red: #b00020;",
-        "      --bg: #f6f7fb;",
-        "      --card: #ffffff;",
-        "      --text: #1b1f24;",
-        "      --muted: #5d6771;",
-        "    }",
-        "    * { box-sizing: border-box; }",
-        "    body {",
-        "      margin: 0;",
-        "      font-family: Arial, sans-serif;",
-        "      color: var(--text);",
-        "      background: var(--bg);",
-        "    }",
-        "    .container {",
-        "      max-width: 1100px;",
-        "      margin: 0 auto;",
-        "      padding: 32px 24px 60px;",
-        "    }",
-        "    header {",
-        "      display: flex;",
-        "      align-items: baseline;",
-        "      justify-content: space-between;",
-        "      flex-wrap: wrap;",
-        "      gap: 12px;",
-        "    }",
-        "    h1 { margin: 0; font-size: 28px; }",
-        "    .muted { color: var(--muted); font-size: 14px; }",
-        "    .summary {",
-        "      display: grid;",
-        "      grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));",
-        "      gap: 16px;",
-        "      margin: 24px 0;",
-        "    }",
-        "    .card {",
-        "      background: var(--card);",
-        "      padding: 16px;",
-        "      border-radius: 10px;",
-        "      box-shadow: 0 2px 8px rgba(0, 0, 0, 0.04);",
-        "    }",
-        "    .card h2 { margin: 0 0 6px; font-size: 18px; }",
-        "    .status-pill {",
-        "      display: inline-flex;",
-        "      align-items: center;",
-        "      gap: 6px;",
-        "      font-weight: 600;",
-        "      padding: 4px 10px;",
-        "      border-radius: 999px;",
-        "      font-size: 12px;",
-        "      letter-spacing: 0.04em;",
-        "    }",
-        "    .status-pill.green { background: rgba(31, 122, 31, 0.12); color: var(--green); }",
-        "    .status-pill.yellow { background: rgba(179, 107, 0, 0.12); color: var(--yellow); }",
-        "    .status-pill.red { background: rgba(176, 0, 32, 0.12); color: var(--red); }",
-        "    .dataset {",
-        "      background: var(--card);",
-        "      border-radius: 12px;",
-        "      padding: 20px;",
-        "      margin-bottom: 20px;",
-        "      border-left: 6px solid transparent;",
-        "    }",
-        "    .dataset.green { border-left-color: var(--green); }",
-        "    .dataset.yellow { border-left-color: var(--yellow); }",
-        "    .dataset.red { border-left-color: var(--red); }",
-        "    .dataset-header {",
-        "      display: flex;",
-        "      align-items: center;",
-        "      justify-content: space-between;",
-        "      gap: 12px;",
-        "      flex-wrap: wrap;",
-        "    }",
-        "    .dataset-header h2 { margin: 0; font-size: 20px; }",
-        "    .meta-grid {",
-        "      display: grid;",
-        "      grid-template-columns: repeat(auto-fit, minmax(220px, 1fr));",
-        "      gap: 10px 20px;",
-        "      margin: 14px 0 18px;",
-        "      font-size: 14px;",
-        "    }",
-        "    .meta-grid div span { color: var(--muted); }",
-        "    table { width: 100%; border-collapse: collapse; }",
-        "    th, td { text-align: left; padding: 10px 8px; font-size: 14px; }",
-        "    th { border-bottom: 1px solid #e0e4ea; color: var(--muted); }",
-        "    tr + tr td { border-top: 1px solid #f0f2f5; }",
-        "    details { margin-top: 6px; }",
-        "    pre {",
-        "      background: #f4f5f8;",
-        "      padding: 10px;",
-        "      border-radius: 8px;",
-        "      overflow-x: auto;",
-        "      font-size: 12px;",
-        "    }",
-        "  </style>",
-        "</head>",
-        "<body>",
-        "  <div class=\"container\">",
-        "    <header>",
-        f"      <h1>{escape(title)}</h1>",
-        f"      <div class=\"muted\">Generated at {escape(report.generated_at.isoformat())}</div>",
-        "    </header>",
-        "    <section class=\"summary\">",
-        f"      <div class=\"card\"><h2>Total</h2><div>{summary['total']}</div></div>",
-        f"      <div class=\"card\"><h2>Green</h2><div>{summary['GREEN']}</div></div>",
-        f"      <div class=\"card\"><h2>Yellow</h2><div>{summary['YELLOW']}</div></div>",
-        f"      <div class=\"card\"><h2>Red</h2><div>{summary['RED']}</div></div>",
-        "    </section>",
+    parts: List[str] = [
+        _HTML_HEAD_TEMPLATE.format(title=title_escaped),
+        _HTML_STYLE,
+        _HTML_BODY_OPEN_TEMPLATE.format(
+            title=title_escaped,
+            generated_at=escape(report.generated_at.isoformat()),
+            total=summary["total"],
+            green=summary["GREEN"],
+            yellow=summary["YELLOW"],
+            red=summary["RED"],
+        ),
     ]
 
     for dataset_report in report.datasets:
         dataset = dataset_report.dataset
         status_value = dataset_report.status.value
         status_class = _status_class(status_value)
-        lines.extend(
-            [
-                f"    <section class=\"dataset {status_class}\">",
-                "      <div class=\"dataset-header\">",
-                f"        <h2>{escape(dataset.name)}</h2>",
-                f"        <span class=\"status-pill {status_class}\">{escape(status_value)}</span>",
-                "      </div>",
-                "      <div class=\"meta-grid\">",
-                f"        <div><span>Description:</span> {escape(dataset.description or '-')}</div>",
-                f"        <div><span>Location:</span> {escape(dataset.location or '-')}</div>",
-                f"        <div><span>Owner:</span> {escape(dataset.owner or '-')}</div>",
-                f"        <div><span>Source:</span> {escape(dataset.source or '-')}</div>",
-                f"        <div><span>Last Updated:</span> {escape(_format_value(dataset.get('last_updated')))}</div>",
-                "      </div>",
-                "      <table>",
-                "        <thead>",
-                "          <tr>",
-                "            <th>Check</th>",
-                "            <th>Status</th>",
-                "            <th>Message</th>",
-                "            <th>Details</th>",
-                "          </tr>",
-                "        </thead>",
-                "        <tbody>",
-            ]
+        parts.append(
+            _DATASET_OPEN_TEMPLATE.format(
+                cls=status_class,
+                name=escape(dataset.name),
+                status=_escape_cached(status_value),
+                description=escape(dataset.description or "-"),
+                location=escape(dataset.location or "-"),
+                owner=_escape_cached(dataset.owner or "-"),
+                source=_escape_cached(dataset.source or "-"),
+                last_updated=escape(_format_value(dataset.get("last_updated"))),
+            )
         )
 
         for check in dataset_report.checks:
             check_status = check.status.value
             details_payload = check.details or {}
             if details_payload:
-                details_text = escape(json.dumps(details_payload, indent=2, ensure_ascii=True, sort_keys=True))
+                details_text = escape(_DETAILS_ENCODER.encode(details_payload))
                 details_html = (
                     "<details><summary>View</summary>"
                     f"<pre>{details_text}</pre>"
@@ -182,24 +252,18 @@ def render_html(report: HealthReport, title: str = "Dataset Health") -> str:
                 )
             else:
                 details_html = "-"
-            lines.extend(
-                [
-                    "          <tr>",
-                    f"            <td>{escape(check.name)}</td>",
-                    f"            <td><span class=\"status-pill {_status_class(check_status)}\">{escape(check_status)}</span></td>",
-                    f"            <td>{escape(check.message)}</td>",
-                    f"            <td>{details_html}</td>",
-                    "          </tr>",
-                ]
+            parts.append(
+                _ROW_TEMPLATE
+                % (
+                    _escape_cached(check.name),
+                    _status_class(check_status),
+                    _escape_cached(check_status),
+                    escape(check.message),
+                    details_html,
+                )
             )
 
-        lines.extend(
-            [
-                "        </tbody>",
-                "      </table>",
-                "    </section>",
-            ]
-        )
+        parts.append(_DATASET_CLOSE)
 
-    lines.extend(["  </div>", "</body>", "</html>"])
-    return "\n".join(lines)
+    parts.append(_HTML_EPILOGUE)
+    return "".join(parts)
@@ -1,22 +1,32 @@
 from __future__ import annotations
 
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Iterable, List
+from functools import partial
+import os
+import pickle
+from typing import Dict, Iterable, Iterator, List
 
 from registry import CheckRegistry, CheckResult, Dataset, Status
 
 
+_SEVERITY = {Status.GREEN: 0, Status.YELLOW: 1, Status.RED: 2}
+_BY_SEVERITY = (Status.GREEN, Status.YELLOW, Status.RED)
+
+
 def aggregate_status(results: Iterable[CheckResult]) -> Status:
-    statuses = {result.status for result in results}
-    if Status.RED in statuses:
-        return Status.RED
-    if Status.YELLOW in statuses:
-        return Status.YELLOW
-    return Status.GREEN
+    worst = 0
+    for result in results:
+        severity = _SEVERITY[result.status]
+        if severity > worst:
+            if severity == 2:
+                return Status.RED
+            worst = severity
+    return _BY_SEVERITY[worst]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DatasetHealth:
     dataset: Dataset
     status: Status
@@ -30,36 +40,119 @@ class DatasetHealth:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthReport:
     generated_at: datetime
     datasets: List[DatasetHealth]
+    _summary: Dict[str, int] | None = field(default=None, init=False, repr=False, compare=False)
+    _overall: Status | None = field(default=None, init=False, repr=False, compare=False)
+
+    def overall_status(self) -> Status:
+        cached = self._overall
+        if cached is not None:
+            return cached
+        overall = Status.GREEN
+        for dataset in self.datasets:
+            status = dataset.status
+            if status is Status.RED:
+                overall = Status.RED
+                break
+            if status is Status.YELLOW:
+                overall = Status.YELLOW
+        object.__setattr__(self, "_overall", overall)
+        return overall
 
     def summary(self) -> Dict[str, int]:
+        cached = self._summary
+        if cached is not None:
+            return cached
         counts = {status.value: 0 for status in Status}
         for dataset in self.datasets:
             counts[dataset.status.value] += 1
         counts["total"] = len(self.datasets)
+        object.__setattr__(self, "_summary", counts)
         return counts
 
+    def iter_datasets_as_dict(self) -> Iterator[Dict[str, object]]:
+        for dataset in self.datasets:
+            yield dataset.to_dict()
+
     def to_dict(self) -> Dict[str, object]:
         return {
             "generated_at": self.generated_at.isoformat(),
             "summary": self.summary(),
-            "datasets": [dataset.to_dict() for dataset in self.datasets],
+            "datasets": list(self.iter_datasets_as_dict()),
         }
 
 
-def evaluate_dataset(dataset: Dataset, registry: CheckRegistry, now: datetime) -> DatasetHealth:
-    check_results = registry.run_all(dataset, now)
+def evaluate_dataset(
+    dataset: Dataset,
+    registry: CheckRegistry,
+    now: datetime,
+    precomputed: Dict[str, CheckResult] | None = None,
+) -> DatasetHealth:
+    check_results = registry.run_all(dataset, now, precomputed=precomputed)
     status = aggregate_status(check_results)
     return DatasetHealth(dataset=dataset, status=status, checks=check_results)
 
 
-def evaluate_all(datasets: Iterable[Dataset], registry: CheckRegistry, now: datetime | None = None) -> HealthReport:
+def _evaluate_one(
+    item: tuple[Dataset, Dict[str, CheckResult] | None],
+    registry: CheckRegistry,
+    now: datetime,
+) -> DatasetHealth:
+    dataset, precomputed = item
+    return evaluate_dataset(dataset, registry=registry, now=now, precomputed=precomputed)
+
+
+SERIAL_THRESHOLD = 4
+BATCH_THRESHOLD = 64
+
+
+def _make_executor(max_workers: int, registry: CheckRegistry) -> Executor:
+    if os.environ.get("DATASET_HEALTH_PROCESSES"):
+        try:
+            pickle.dumps(registry)
+        except Exception:
+            pass
+        else:
+            return ProcessPoolExecutor(max_workers=max_workers)
+    return ThreadPoolExecutor(max_workers=max_workers)
+
+
+def evaluate_all(
+    datasets: Iterable[Dataset],
+    registry: CheckRegistry,
+    now: datetime | None = None,
+    max_workers: int | None = None,
+) -> HealthReport:
     evaluation_time = now or datetime.now(timezone.utc)
-    dataset_reports = [
-        evaluate_dataset(dataset, registry=registry, now=evaluation_time)
-        for dataset in datasets
+    dataset_list = list(datasets)
+
+    precomputed: Dict[int, Dict[str, CheckResult]] = {}
+    if len(dataset_list) >= BATCH_THRESHOLD:
+        from checks._batch import batch_numeric
+
+        precomputed = batch_numeric(dataset_list, registry, evaluation_time)
+
+    if len(dataset_list) <= SERIAL_THRESHOLD and max_workers is None:
+        dataset_reports = [
+            evaluate_dataset(
+                dataset,
+                registry=registry,
+                now=evaluation_time,
+                precomputed=precomputed.get(index),
+            )
+            for index, dataset in enumerate(dataset_list)
+        ]
+        return HealthReport(generated_at=evaluation_time, datasets=dataset_reports)
+
+    workers = max_workers or min(32, len(dataset_list))
+    items = [
+        (dataset, precomputed.get(index))
+        for index, dataset in enumerate(dataset_list)
     ]
+    runner = partial(_evaluate_one, registry=registry, now=evaluation_time)
+    with _make_executor(workers, registry) as executor:
+        dataset_reports = list(executor.map(runner, items))
     return HealthReport(generated_at=evaluation_time, datasets=dataset_reports)
@@ -1,31 +1,44 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+import io
 import json
-from typing import Dict, Iterable, List, Optional
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 from health import HealthReport
 from registry import Status
 
 
-STATUS_TO_VALUE = {
-    Status.GREEN: 0,
-    Status.YELLOW: 1,
-    Status.RED: 2,
-}
+# One encoder instance amortizes option parsing across rows; compact
+# separators match orjson's output shape.
+_ENCODER = json.JSONEncoder(ensure_ascii=True, separators=(",", ":"))
+
+
+if orjson is not None:
+
+    def _dumps(payload: object) -> str:
+        # orjson emits UTF-8 rather than ASCII-escaped output; report
+        # fields are plain ASCII in practice.
+        return orjson.dumps(payload).decode("utf-8")
+
+else:
+
+    def _dumps(payload: object) -> str:
+        return _ENCODER.encode(payload)
 
 
 def overall_status(report: HealthReport) -> Status:
-    statuses = {dataset.status for dataset in report.datasets}
-    if Status.RED in statuses:
-        return Status.RED
-    if Status.YELLOW in statuses:
-        return Status.YELLOW
-    return Status.GREEN
+    return report.overall_status()
 
 
 def status_value(status: Status) -> int:
-    return STATUS_TO_VALUE[status]
+    return status.code
 
 
 def render_summary_json(report: HealthReport) -> Dict[str, object]:
@@ -36,46 +49,96 @@ def render_summary_json(report: HealthReport) -> Dict[str, object]:
     }
 
 
-def render_jsonl(report: HealthReport) -> str:
-    lines: List[str] = []
+def _jsonl_payloads(report: HealthReport) -> Iterator[Dict[str, object]]:
     for dataset_report in report.datasets:
-        dataset = dataset_report.dataset
-        payload = {
-            "dataset": dataset.name,
+        yield {
+            "dataset": dataset_report.dataset.name,
             "status": dataset_report.status.value,
-            "owner": dataset.owner,
-            "location": dataset.location,
+            "owner": dataset_report.dataset.owner,
+            "location": dataset_report.dataset.location,
         }
-        lines.append(json.dumps(payload, ensure_ascii=True))
-    return "\n".join(lines)
+
+
+def write_jsonl(report: HealthReport, fp: IO[str]) -> None:
+    """Stream newline-terminated JSONL rows to a file-like sink.
+
+    Unlike render_jsonl, no report-sized string is built; peak memory is
+    one encoded row.
+    """
+    for payload in _jsonl_payloads(report):
+        fp.write(_dumps(payload))
+        fp.write("\n")
+
+
+def render_jsonl(report: HealthReport) -> str:
+    if orjson is not None:
+        return b"\n".join(orjson.dumps(payload) for payload in _jsonl_payloads(report)).decode("utf-8")
+    return "\n".join(_ENCODER.encode(payload) for payload in _jsonl_payloads(report))
+
+
+_PROM_ESCAPE = str.maketrans({"\\": "\\\\", "\n": "\\n", '"': '\\"'})
+_PROM_BAD = frozenset('\\\n"')
 
 
 def _prom_label_value(value: str) -> str:
-    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+    # Most dataset names contain none of the escaped characters; return
+    # them untouched without allocating a new string.
+    if not _PROM_BAD.intersection(value):
+        return value
+    return value.translate(_PROM_ESCAPE)
 
 
-def render_prometheus(report: HealthReport) -> str:
-    overall = overall_status(report)
+# Static HELP/TYPE text is formatted once per render; only the gauge
+# values vary between calls. The template is bytes so rendering skips
+# the str machinery and scrapes can ship the buffer without encoding.
+_PROM_HEADER_TEMPLATE = (
+    b"# HELP dataset_health_status Overall dataset health status (0=GREEN,1=YELLOW,2=RED).\n"
+    b"# TYPE dataset_health_status gauge\n"
+    b"dataset_health_status %d\n"
+    b"# HELP dataset_health_summary Dataset counts by status.\n"
+    b"# TYPE dataset_health_summary gauge\n"
+    b'dataset_health_summary{status="GREEN"} %d\n'
+    b'dataset_health_summary{status="YELLOW"} %d\n'
+    b'dataset_health_summary{status="RED"} %d\n'
+    b'dataset_health_summary{status="TOTAL"} %d\n'
+    b"# HELP dataset_health_dataset_status Per-dataset health status (0=GREEN,1=YELLOW,2=RED).\n"
+    b"# TYPE dataset_health_dataset_status gauge"
+)
+
+
+_STATUS_VALUE_BYTES = {status: str(status.code).encode("ascii") for status in Status}
+
+
+def render_prometheus_bytes(report: HealthReport) -> bytes:
+    """Render the Prometheus exposition format as UTF-8 bytes.
+
+    The text format is byte-oriented on the wire; rendering directly into
+    a BytesIO avoids a report-sized str plus the encode most callers
+    would do anyway.
+    """
     summary = report.summary()
-    lines: List[str] = [
-        "# HELP dataset_health_status Overall dataset health status (0=GREEN,1=YELLOW,2=RED).",
-        "# TYPE dataset_health_status gauge",
-        f"dataset_health_status {status_value(overall)}",
-        "# HELP dataset_health_summary Dataset counts by status.",
-        "# TYPE dataset_health_summary gauge",
-        f'dataset_health_summary{{status="GREEN"}} {summary["GREEN"]}',
-        f'dataset_health_summary{{status="YELLOW"}} {summary["YELLOW"]}',
-        f'dataset_health_summary{{status="RED"}} {summary["RED"]}',
-        f'dataset_health_summary{{status="TOTAL"}} {summary["total"]}',
-        "# HELP dataset_health_dataset_status Per-dataset health status (0=GREEN,1=YELLOW,2=RED).",
-        "# TYPE dataset_health_dataset_status gauge",
-    ]
+    green, yellow, red, total = (
+        summary["GREEN"],
+        summary["YELLOW"],
+        summary["RED"],
+        summary["total"],
+    )
+    buf = io.BytesIO()
+    buf.write(
+        _PROM_HEADER_TEMPLATE
+        % (status_value(overall_status(report)), green, yellow, red, total)
+    )
+    write = buf.write
     for dataset_report in report.datasets:
-        dataset_name = _prom_label_value(dataset_report.dataset.name)
-        lines.append(
-            f'dataset_health_dataset_status{{dataset="{dataset_name}"}} {status_value(dataset_report.status)}'
-        )
-    return "\n".join(lines)
+        write(b'\ndataset_health_dataset_status{dataset="')
+        write(_prom_label_value(dataset_report.dataset.name).encode("utf-8"))
+        write(b'"} ')
+        write(_STATUS_VALUE_BYTES[dataset_report.status])
+    return buf.getvalue()
+
+
+def render_prometheus(report: HealthReport) -> str:
+    return render_prometheus_bytes(report).decode("utf-8")
 
 
 def parse_cloudwatch_dimensions(raw: str) -> List[Dict[str, str]]:
@@ -97,52 +160,78 @@ def parse_cloudwatch_dimensions(raw: str) -> List[Dict[str, str]]:
     return dimensions
 
 
+# Metrics travel the emit path as compact (name, extra_dimension, value,
+# unit) tuples; extra_dimension is None or a (name, value) pair appended
+# to the base dimensions. The boto3 dicts are only materialized per
+# batch, right before PutMetricData.
+_MetricTuple = Tuple[str, Optional[Tuple[str, str]], int, str]
+
+
+def _metric_tuples(
+    report: HealthReport,
+    include_datasets: bool,
+    overall: Optional[Status],
+    summary: Optional[Dict[str, int]],
+) -> Iterator[_MetricTuple]:
+    if overall is None:
+        overall = overall_status(report)
+    if summary is None:
+        summary = report.summary()
+    yield ("DatasetHealthOverallStatus", None, status_value(overall), "None")
+    yield ("DatasetHealthTotal", None, summary["total"], "Count")
+    for status in ("GREEN", "YELLOW", "RED"):
+        yield ("DatasetHealthCount", ("Status", status), summary[status], "Count")
+    if include_datasets:
+        for dataset_report in report.datasets:
+            yield (
+                "DatasetHealthDatasetStatus",
+                ("Dataset", dataset_report.dataset.name),
+                status_value(dataset_report.status),
+                "None",
+            )
+
+
+def _metric_dict(
+    metric: _MetricTuple, base_dimensions: List[Dict[str, str]]
+) -> Dict[str, object]:
+    name, extra, value, unit = metric
+    if extra is None:
+        dimensions = base_dimensions
+    else:
+        # List unpacking copies base_dimensions without the intermediate
+        # single-element list that + would build.
+        dimensions = [*base_dimensions, {"Name": extra[0], "Value": extra[1]}]
+    return {"MetricName": name, "Dimensions": dimensions, "Value": value, "Unit": unit}
+
+
+def _validate_dimensions(base_dimensions: List[Dict[str, str]]) -> None:
+    if len(base_dimensions) > 9:
+        raise ValueError("CloudWatch dimensions limit exceeded (max 9 base dimensions).")
+
+
 def build_cloudwatch_metrics(
     report: HealthReport,
     base_dimensions: List[Dict[str, str]],
     include_datasets: bool = True,
+    *,
+    overall: Optional[Status] = None,
+    summary: Optional[Dict[str, int]] = None,
 ) -> List[Dict[str, object]]:
-    if len(base_dimensions) > 9:
-        raise ValueError("CloudWatch dimensions limit exceeded (max 9 base dimensions).")
-    summary = report.summary()
-    metrics: List[Dict[str, object]] = [
-        {
-            "MetricName": "DatasetHealthOverallStatus",
-            "Dimensions": base_dimensions,
-            "Value": status_value(overall_status(report)),
-            "Unit": "None",
-        },
-        {
-            "MetricName": "DatasetHealthTotal",
-            "Dimensions": base_dimensions,
-            "Value": summary["total"],
-            "Unit": "Count",
-        },
-    ]
+    """Build PutMetricData payloads for the report.
 
-    for status in ("GREEN", "YELLOW", "RED"):
-        metrics.append(
-            {
-                "MetricName": "DatasetHealthCount",
-                "Dimensions": base_dimensions + [{"Name": "Status", "Value": status}],
-                "Value": summary[status],
-                "Unit": "Count",
-            }
-        )
+    Callers that already hold the overall status or summary counts (the
+    CLI computes both for its own output) can pass them in to skip the
+    aggregation here.
+    """
+    _validate_dimensions(base_dimensions)
+    return [
+        _metric_dict(metric, base_dimensions)
+        for metric in _metric_tuples(report, include_datasets, overall, summary)
+    ]
 
-    if include_datasets:
-        for dataset_report in report.datasets:
-            metrics.append(
-                {
-                    "MetricName": "DatasetHealthDatasetStatus",
-                    "Dimensions": base_dimensions
-                    + [{"Name": "Dataset", "Value": dataset_report.dataset.name}],
-                    "Value": status_value(dataset_report.status),
-                    "Unit": "None",
-                }
-            )
 
-    return metrics
+# PutMetricData accepts at most 20 metrics per request.
+CLOUDWATCH_MAX_BATCH_SIZE = 20
 
 
 def emit_cloudwatch_metrics(
@@ -151,6 +240,9 @@ def emit_cloudwatch_metrics(
     base_dimensions: List[Dict[str, str]],
     region: Optional[str] = None,
     include_datasets: bool = True,
+    batch_size: int = CLOUDWATCH_MAX_BATCH_SIZE,
+    overall: Optional[Status] = None,
+    summary: Optional[Dict[str, int]] = None,
 ) -> int:
     try:
         import boto3
@@ -159,15 +251,29 @@ def emit_cloudwatch_metrics(
             "CloudWatch output requires boto3. Install with: pip install -e '.[aws]'"
         ) from exc
 
-    metrics = build_cloudwatch_metrics(
-        report, base_dimensions=base_dimensions, include_datasets=include_datasets
-    )
+    if not 1 <= batch_size <= CLOUDWATCH_MAX_BATCH_SIZE:
+        raise ValueError(
+            f"CloudWatch batch size must be between 1 and {CLOUDWATCH_MAX_BATCH_SIZE}."
+        )
+
+    _validate_dimensions(base_dimensions)
+    metrics = list(_metric_tuples(report, include_datasets, overall, summary))
 
     client = boto3.client("cloudwatch", region_name=region)
-    chunk_size = 20
-    for idx in range(0, len(metrics), chunk_size):
+    chunks = [metrics[idx : idx + batch_size] for idx in range(0, len(metrics), batch_size)]
+
+    def _put(chunk: List[_MetricTuple]) -> None:
         client.put_metric_data(
             Namespace=namespace,
-            MetricData=metrics[idx : idx + chunk_size],
+            MetricData=[_metric_dict(metric, base_dimensions) for metric in chunk],
         )
+
+    if len(chunks) <= 1:
+        for chunk in chunks:
+            _put(chunk)
+    else:
+        # boto3 clients are thread-safe for method calls; overlapping the
+        # PUTs hides the per-request round trip.
+        with ThreadPoolExecutor(max_workers=min(8, len(chunks))) as executor:
+            list(executor.map(_put, chunks))
     return len(metrics)
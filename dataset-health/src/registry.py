@@ -1,23 +1,45 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+import functools
 import importlib
 import importlib.metadata
 from pathlib import Path
+import sys
 from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on libyaml build
+    from yaml import SafeLoader as _SafeLoader
+
 
 class Status(str, Enum):
-    GREEN = "GREEN"
-    YELLOW = "YELLOW"
-    RED = "RED"
+    """Health status with a numeric severity code (0=GREEN,1=YELLOW,2=RED).
+
+    ``value`` stays the status string for serialization; ``code`` gives
+    metric emitters the numeric form without a lookup table.
+    """
+
+    code: int
+
+    def __new__(cls, value: str, code: int) -> "Status":
+        obj = str.__new__(cls, value)
+        obj._value_ = value
+        obj.code = code
+        return obj
 
+    GREEN = ("GREEN", 0)
+    YELLOW = ("YELLOW", 1)
+    RED = ("RED", 2)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class CheckResult:
     name: str
     status: Status
@@ -33,7 +55,7 @@ class CheckResult:
         }
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Dataset:
     name: str
     description: str = ""
@@ -41,10 +63,27 @@ class Dataset:
     owner: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
     source: str = ""
+    _parsed_datetimes: Dict[str, Optional[datetime]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def get(self, key: str, default: Any = None) -> Any:
         return self.metadata.get(key, default)
 
+    def get_datetime(self, key: str) -> Optional[datetime]:
+        """Return ``parse_datetime(self.get(key))``, cached per instance.
+
+        Checks reparse the same timestamps on every run; the cache makes
+        repeat evaluations a dict hit. Metadata itself is never mutated,
+        so ``to_dict`` keeps emitting the raw YAML values.
+        """
+        cache = self._parsed_datetimes
+        if key in cache:
+            return cache[key]
+        parsed = parse_datetime(self.metadata.get(key))
+        cache[key] = parsed
+        return parsed
+
     def to_dict(self) -> Dict[str, Any]:
         payload = {
             "name": self.name,
@@ -57,7 +96,7 @@ class Dataset:
         return payload
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CheckSpec:
     name: str
     description: str
@@ -67,22 +106,38 @@ class CheckSpec:
 class CheckRegistry:
     def __init__(self) -> None:
         self._checks: Dict[str, CheckSpec] = {}
+        self._ordered: Optional[Tuple[CheckSpec, ...]] = None
 
     def register(self, name: str, description: str, runner: Callable[[Dataset, datetime], CheckResult]) -> None:
         if name in self._checks:
             raise ValueError(f"Check already registered: {name}")
         self._checks[name] = CheckSpec(name=name, description=description, runner=runner)
+        self._ordered = None
+
+    def _ordered_specs(self) -> Tuple[CheckSpec, ...]:
+        if self._ordered is None:
+            self._ordered = tuple(self._checks[name] for name in sorted(self._checks))
+        return self._ordered
 
     def list(self) -> List[CheckSpec]:
-        return [self._checks[name] for name in sorted(self._checks)]
-
-    def run_all(self, dataset: Dataset, now: datetime) -> List[CheckResult]:
-        results: List[CheckResult] = []
-        for spec in self.list():
-            result = spec.runner(dataset, now)
-            if not isinstance(result, CheckResult):
-                raise ValueError(f"Check {spec.name} returned invalid result type")
-            results.append(result)
+        return list(self._ordered_specs())
+
+    def run_all(
+        self,
+        dataset: Dataset,
+        now: datetime,
+        precomputed: Optional[Dict[str, CheckResult]] = None,
+    ) -> List[CheckResult]:
+        specs = self._ordered_specs()
+        results: List[Optional[CheckResult]] = [None] * len(specs)
+        lookup = precomputed.get if precomputed else None
+        for index, spec in enumerate(specs):
+            result = lookup(spec.name) if lookup else None
+            if result is None:
+                result = spec.runner(dataset, now)
+                if type(result) is not CheckResult:
+                    raise ValueError(f"Check {spec.name} returned invalid result type")
+            results[index] = result
         return results
 
 
@@ -100,43 +155,60 @@ def register_check(name: str, description: str) -> Callable[[Callable[[Dataset,
 class DatasetRegistry:
     def __init__(self) -> None:
         self._datasets: Dict[str, Dataset] = {}
+        self._sorted_cache: Optional[List[Dataset]] = None
 
     def add(self, dataset: Dataset) -> None:
         if dataset.name in self._datasets:
             raise ValueError(f"Dataset already registered: {dataset.name}")
         self._datasets[dataset.name] = dataset
+        self._sorted_cache = None
 
     def list(self) -> List[Dataset]:
-        return [self._datasets[name] for name in sorted(self._datasets)]
+        if self._sorted_cache is None:
+            self._sorted_cache = [self._datasets[name] for name in sorted(self._datasets)]
+        return list(self._sorted_cache)
 
     def load_from_path(self, path: Path) -> None:
         if path.is_dir():
             files = sorted({*path.glob("*.yaml"), *path.glob("*.yml")})
-            for file_path in files:
-                self._load_file(file_path)
+            if len(files) > 1:
+                # Parsing is pure and thread-safe; reads and libyaml
+                # parsing overlap across files. Registration stays serial
+                # so duplicate detection is deterministic.
+                with ThreadPoolExecutor() as executor:
+                    parsed = list(executor.map(self._parse_file, files))
+            else:
+                parsed = [self._parse_file(file_path) for file_path in files]
+            for datasets in parsed:
+                for dataset in datasets:
+                    self.add(dataset)
             return
         if path.is_file():
-            self._load_file(path)
+            for dataset in self._parse_file(path):
+                self.add(dataset)
             return
         raise FileNotFoundError(f"Dataset path not found: {path}")
 
-    def _load_file(self, path: Path) -> None:
-        payload = yaml.safe_load(path.read_text()) or {}
+    def _parse_file(self, path: Path) -> List[Dataset]:
+        payload = yaml.load(path.read_bytes(), Loader=_SafeLoader) or {}
         if isinstance(payload, list):
             datasets = payload
         elif isinstance(payload, dict):
             datasets = [payload]
         else:
             raise ValueError(f"Invalid dataset definition in {path}")
-        for dataset_payload in datasets:
-            dataset = _dataset_from_dict(dataset_payload, source=str(path))
-            self.add(dataset)
+        return [
+            _dataset_from_dict(dataset_payload, source=str(path))
+            for dataset_payload in datasets
+        ]
 
 
 def _dataset_from_dict(payload: Dict[str, Any], source: str) -> Dataset:
     if not isinstance(payload, dict):
         raise ValueError("Dataset entry must be a mapping")
-    name = str(payload.get("name") or "").strip()
+    # Interned names make the repeated hashing and equality checks in
+    # registries and metric renderers pointer comparisons.
+    name = sys.intern(str(payload.get("name") or "").strip())
     if not name:
         raise ValueError("Dataset entry missing required field: name")
     description = str(payload.get("description") or "")
@@ -167,19 +239,29 @@ def parse_datetime(value: Any) -> Optional[datetime]:
     if isinstance(value, (int, float)):
         return datetime.fromtimestamp(float(value), tz=timezone.utc)
     if isinstance(value, str):
-        text = value.strip()
-        if text.endswith("Z"):
-            text = f"{text[:-1]}+00:00"
-        try:
-            parsed = datetime.fromisoformat(text)
-        except ValueError:
-            return None
-        if parsed.tzinfo is None:
-            parsed = parsed.replace(tzinfo=timezone.utc)
-        return parsed
+        return _parse_datetime_str(value)
     return None
 
 
+@functools.lru_cache(maxsize=8192)
+def _parse_datetime_str(value: str) -> Optional[datetime]:
+    # Timestamps repeat heavily across datasets (e.g. partitions sharing an
+    # update time), so cache parses for the lifetime of the process.
+    # fromisoformat on Python 3.11+ accepts the trailing "Z" directly, and
+    # well-formed values have no surrounding whitespace, so only strip when
+    # the edges actually need it.
+    text = value
+    if text[:1].isspace() or text[-1:].isspace():
+        text = text.strip()
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
 def load_builtin_checks() -> None:
     for module in ("checks.freshness", "checks.completeness", "checks.schema", "checks.volume"):
         importlib.import_module(module)
@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
-from health import aggregate_status, evaluate_all
+from checks.completeness import check_completeness
+from checks.freshness import check_freshness
+from checks.volume import check_volume
+from health import BATCH_THRESHOLD, aggregate_status, evaluate_all, evaluate_dataset
 from registry import CheckRegistry, CheckResult, Dataset, Status
 
 
@@ -34,3 +37,54 @@ def test_evaluate_all_summary() -> None:
     assert summary["RED"] == 1
     assert summary["YELLOW"] == 0
     assert summary["total"] == 2
+
+
+def test_evaluate_all_parallel_preserves_order() -> None:
+    registry = CheckRegistry()
+
+    def runner(dataset: Dataset, now: datetime) -> CheckResult:
+        return CheckResult(name="dummy", status=Status.GREEN, message="ok")
+
+    registry.register("dummy", "test", runner)
+
+    datasets = [Dataset(name=f"ds-{index}") for index in range(10)]
+    report = evaluate_all(
+        datasets,
+        registry,
+        now=datetime(2026, 2, 7, tzinfo=timezone.utc),
+        max_workers=4,
+    )
+
+    assert [item.dataset.name for item in report.datasets] == [f"ds-{index}" for index in range(10)]
+
+
+def test_evaluate_all_batched_matches_scalar() -> None:
+    registry = CheckRegistry()
+    registry.register("completeness", "test", check_completeness)
+    registry.register("freshness", "test", check_freshness)
+    registry.register("volume", "test", check_volume)
+
+    now = datetime(2026, 2, 7, 18, 30, 0, tzinfo=timezone.utc)
+    datasets = []
+    for index in range(BATCH_THRESHOLD + 10):
+        metadata = {
+            "record_count": 80 + index,
+            "expected_min_records": 100,
+            "bytes": 900 + index * 10,
+            "expected_min_bytes": 1000,
+            "last_updated": "2026-02-06T18:30:00Z",
+            "freshness_hours": 12 + index,
+        }
+        if index % 7 == 0:
+            metadata.pop("record_count")
+        if index % 11 == 0:
+            metadata["expected_min_bytes"] = "not-a-number"
+        datasets.append(Dataset(name=f"ds-{index}", metadata=metadata))
+
+    report = evaluate_all(datasets, registry, now=now)
+    expected = [
+        evaluate_dataset(dataset, registry=registry, now=now)
+        for dataset in datasets
+    ]
+
+    assert [item.to_dict() for item in report.datasets] == [item.to_dict() for item in expected]
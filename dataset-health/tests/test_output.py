@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+import io
 import json
 
 from health import DatasetHealth, HealthReport
@@ -12,6 +13,7 @@ from output import (
     render_prometheus,
     render_summary_json,
     status_value,
+    write_jsonl,
 )
 from registry import CheckResult, Dataset, Status
 
@@ -55,6 +57,14 @@ def test_jsonl_output() -> None:
     assert {item["dataset"] for item in payloads} == {"alpha", "beta"}
 
 
+def test_write_jsonl_streams_rows() -> None:
+    report = _report()
+    buf = io.StringIO()
+    write_jsonl(report, buf)
+    lines = buf.getvalue().splitlines()
+    assert lines == render_jsonl(report).splitlines()
+
+
 def test_prometheus_output() -> None:
     report = _report()
     output = render_prometheus(report)